@@ -1,7 +1,29 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
+# Default inputs shared by every scenario
+_SHARED = {
+    "annual_trapped_funds": {
+        "Bangladesh": 1_000_000.0,
+        "Pakistan": 500_000.0,
+        "Others": 300_000.0
+    },
+    "transactions_per_year": {
+        "Bangladesh": 12,
+        "Pakistan": 12,
+        "Others": 12
+    }
+}
+
+# Per-scenario defaults: (transaction fee %, annual loss rate %)
+_SCENARIO_DELTAS = {
+    "Conservative Estimate": (3.0, 10.0),
+    "Average Estimate": (2.25, 15.0),
+    "Optimistic Estimate": (1.5, 20.0)
+}
+
 # Set the page configuration
 st.set_page_config(page_title="Etihad Airways Savings Projection Dashboard", layout="wide")
 
@@ -15,57 +37,11 @@ This dashboard visualizes the projected savings for Etihad Airways over a custom
 st.sidebar.header("Dashboard Settings")
 
 # Scenario selection
-scenarios = ["Conservative Estimate", "Average Estimate", "Optimistic Estimate"]
+scenarios = list(_SCENARIO_DELTAS)
 selected_scenario = st.sidebar.selectbox("Select Scenario", scenarios)
 
-# Define default parameters based on scenarios
-default_params = {
-    "Conservative Estimate": {
-        "transaction_fee_percent": 3.0,
-        "annual_trapped_funds": {
-            "Bangladesh": 1_000_000.0,  # Converted to float
-            "Pakistan": 500_000.0,
-            "Others": 300_000.0
-        },
-        "annual_loss_rate_percent": 10.0,
-        "transactions_per_year": {
-            "Bangladesh": 12,
-            "Pakistan": 12,
-            "Others": 12
-        }
-    },
-    "Average Estimate": {
-        "transaction_fee_percent": 2.25,
-        "annual_trapped_funds": {
-            "Bangladesh": 1_000_000.0,
-            "Pakistan": 500_000.0,
-            "Others": 300_000.0
-        },
-        "annual_loss_rate_percent": 15.0,
-        "transactions_per_year": {
-            "Bangladesh": 12,
-            "Pakistan": 12,
-            "Others": 12
-        }
-    },
-    "Optimistic Estimate": {
-        "transaction_fee_percent": 1.5,
-        "annual_trapped_funds": {
-            "Bangladesh": 1_000_000.0,
-            "Pakistan": 500_000.0,
-            "Others": 300_000.0
-        },
-        "annual_loss_rate_percent": 20.0,
-        "transactions_per_year": {
-            "Bangladesh": 12,
-            "Pakistan": 12,
-            "Others": 12
-        }
-    }
-}
-
 # Load parameters for the selected scenario
-scenario_params = default_params[selected_scenario]
+default_fee_percent, default_loss_rate_percent = _SCENARIO_DELTAS[selected_scenario]
 
 # Allow users to dynamically change the transaction fee
 st.sidebar.subheader("Transaction Fee Settings")
@@ -73,23 +49,45 @@ transaction_fee_percent = st.sidebar.slider(
     "Transaction Fee (%)",
     min_value=0.0,
     max_value=5.0,
-    value=scenario_params["transaction_fee_percent"],
+    value=default_fee_percent,
     step=0.1,
     help="Adjust the blockchain transaction fee percentage."
 )
 
-# Allow users to dynamically change the annual trapped funds
-st.sidebar.subheader("Annual Trapped Funds ($)")
-annual_trapped_funds = {}
-for country, amount in scenario_params["annual_trapped_funds"].items():
-    annual_trapped_funds[country] = st.sidebar.number_input(
-        f"{country} ($)",
-        min_value=0.0,
-        value=float(amount),  # Ensure value is float
-        step=10_000.0,        # Ensure step is float
-        format="%.2f",
-        help=f"Set the annual trapped funds for {country}."
-    )
+# Allow users to dynamically change the annual trapped funds and transactions per country in one editor
+st.sidebar.subheader("Country Settings")
+countries = list(_SHARED["annual_trapped_funds"].keys())
+inputs_df = pd.DataFrame({
+    "Country": countries,
+    "Trapped Funds ($)": [float(_SHARED["annual_trapped_funds"][country]) for country in countries],
+    "Txns/Year": [int(_SHARED["transactions_per_year"][country]) for country in countries]
+})
+edited_inputs_df = st.sidebar.data_editor(
+    inputs_df,
+    num_rows="fixed",
+    hide_index=True,
+    disabled=["Country"],
+    column_config={
+        "Trapped Funds ($)": st.column_config.NumberColumn(
+            min_value=0.0,
+            step=10_000.0,
+            format="%.2f",
+            required=True,
+            help="Set the annual trapped funds for each country."
+        ),
+        "Txns/Year": st.column_config.NumberColumn(
+            min_value=1,
+            max_value=100,
+            step=1,
+            required=True,
+            help="Set the number of blockchain transactions per year for each country."
+        )
+    }
+)
+# Pull the edited columns out as NumPy arrays once, aligned with `countries`,
+# falling back to the defaults for any cell that came back empty
+funds_arr = edited_inputs_df["Trapped Funds ($)"].fillna(inputs_df["Trapped Funds ($)"]).to_numpy(dtype=np.float64)
+txns_arr = edited_inputs_df["Txns/Year"].fillna(inputs_df["Txns/Year"]).to_numpy(dtype=np.int64)
 
 # Allow users to dynamically change the annual loss rate
 st.sidebar.subheader("Annual Loss Rate on Trapped Cash Settings")
@@ -97,7 +95,7 @@ annual_loss_rate_percent = st.sidebar.slider(
     "Annual Loss Rate on Trapped Cash (%)",
     min_value=0.0,
     max_value=25.0,
-    value=scenario_params["annual_loss_rate_percent"],
+    value=default_loss_rate_percent,
     step=0.5,
     help="Adjust the annual loss rate percentage on trapped cash."
 )
@@ -113,126 +111,151 @@ consulting_fee = st.sidebar.number_input(
     help="Set the one-time consulting fee for implementation."
 )
 
-# Allow users to set the number of transactions per annum per country
-st.sidebar.subheader("Transaction Settings")
-transactions_per_year = {}
-for country, txn_default in scenario_params["transactions_per_year"].items():
-    transactions_per_year[country] = st.sidebar.number_input(
-        f"Number of Transactions per Year for {country}",
-        min_value=1,
-        max_value=100,
-        value=int(txn_default),
-        step=1,
-        help=f"Set the number of blockchain transactions per year for {country}."
-    )
-
 # Allow users to select the time horizon
 selected_years = st.sidebar.slider("Select Time Horizon (Years)", 1, 20, 10)
 
-# Function to calculate savings
+# Function to calculate savings, cached on its inputs so unrelated widget changes don't recompute it
+@st.cache_data(show_spinner=False)
 def calculate_savings(transaction_fee, trapped_funds, loss_rate, consulting_fee, years=10):
-    annual_trapped_total = sum(trapped_funds.values())
+    # trapped_funds is an array of per-country amounts
+    annual_trapped_total = trapped_funds.sum()
     annual_current_loss = annual_trapped_total * (loss_rate / 100)
     annual_blockchain_cost = annual_trapped_total * (transaction_fee / 100)
     net_annual_savings = annual_current_loss - annual_blockchain_cost
 
-    cumulative_savings = []
-    total_savings = 0
-    for year in range(1, years + 1):
-        total_savings += net_annual_savings
-        if year == 1:
-            total_savings -= consulting_fee  # One-time consulting fee in the first year
-        cumulative_savings.append(total_savings)
+    # One-time consulting fee paid in the first year, carried through every cumulative value
+    cumulative_savings = np.arange(1, years + 1, dtype=np.float64) * net_annual_savings - consulting_fee
 
     return cumulative_savings, net_annual_savings, annual_current_loss, annual_blockchain_cost
 
+# Function to build the financial summary as a Markdown table
+# (dollar signs are escaped so Streamlit doesn't render them as LaTeX)
+def build_summary_table(total_savings, net_annual_savings, annual_current_loss, annual_blockchain_cost, payback_year):
+    return (
+        "| Metric | Value |\n"
+        "|---|---|\n"
+        f"| Total Savings Over Period (\\$) | \\${total_savings:,.2f} |\n"
+        f"| Net Annual Savings (\\$) | \\${net_annual_savings:,.2f} |\n"
+        f"| Annual Current Loss (\\$) | \\${annual_current_loss:,.2f} |\n"
+        f"| Annual Blockchain Cost (\\$) | \\${annual_blockchain_cost:,.2f} |\n"
+        f"| Payback Period (Years) | {payback_year if payback_year else 'Not within horizon'} |\n"
+    )
+
+# Function to build the scenario details as a Markdown table
+def build_scenario_table(transaction_fee, loss_rate, consulting_fee, countries, trapped_funds, transactions):
+    # trapped_funds and transactions are arrays aligned with countries; their rows are formatted column-wise
+    countries = pd.Series(countries)
+    fund_rows = "| " + countries + " | " + pd.Series(trapped_funds).map("\\${:,.2f}".format) + " |\n"
+    txn_rows = "| " + countries + " | " + pd.Series(transactions).astype(str) + " transactions/year |\n"
+    return (
+        "| Parameter | Value |\n"
+        "|---|---|\n"
+        f"| Transaction Fee (%) | {transaction_fee}% |\n"
+        f"| Annual Loss Rate on Trapped Cash (%) | {loss_rate}% |\n"
+        f"| Consulting Fee (\\$) | \\${consulting_fee:,.2f} |\n"
+        + fund_rows.str.cat()
+        + txn_rows.str.cat()
+    )
+
 # Calculate savings based on user inputs
 cumulative_savings, net_annual_savings, annual_current_loss, annual_blockchain_cost = calculate_savings(
     transaction_fee=transaction_fee_percent,
-    trapped_funds=annual_trapped_funds,
+    trapped_funds=funds_arr,
     loss_rate=annual_loss_rate_percent,
     consulting_fee=consulting_fee,
     years=selected_years
 )
 
-# Financial Summary Section
-st.header("Financial Summary")
-
-# Calculate payback period
+# Calculate payback period: first year in which cumulative savings cover the consulting fee
 payback_year = None
-cumulative = 0
-for year in range(1, selected_years + 1):
-    if year == 1:
-        cumulative += net_annual_savings - (consulting_fee / 1_000_000)
-    else:
-        cumulative += net_annual_savings
-    if payback_year is None and cumulative >= 0:
-        payback_year = year
+if consulting_fee <= 0 and net_annual_savings >= 0:
+    payback_year = 1
+elif net_annual_savings > 0:
+    payback_year = max(1, int(np.ceil(consulting_fee / net_annual_savings)))
+    if payback_year > selected_years:
+        payback_year = None
 
 # Calculate total savings over the selected period
 total_savings_over_period = cumulative_savings[-1]
 
-summary_df = pd.DataFrame({
-    "Metric": [
-        "Total Savings Over Period ($)",
-        "Net Annual Savings ($)",
-        "Annual Current Loss ($)",
-        "Annual Blockchain Cost ($)",
-        "Payback Period (Years)"
-    ],
-    "Value": [
-        f"${total_savings_over_period:,.2f}",
-        f"${net_annual_savings:,.2f}",
-        f"${annual_current_loss:,.2f}",
-        f"${annual_blockchain_cost:,.2f}",
-        f"{payback_year if payback_year else 'Not within horizon'}"
-    ]
-})
-st.table(summary_df)
-
-# Cumulative Savings Over Time Section
-st.header("Cumulative Savings Over Time")
-fig = go.Figure()
-fig.add_trace(go.Scatter(
-    x=list(range(1, selected_years + 1)),
-    y=cumulative_savings,
-    mode='lines+markers',
-    name='Cumulative Savings',
-    line=dict(color='green')
-))
-fig.update_layout(
-    title=f"Cumulative Savings over {selected_years} Years - {selected_scenario}",
-    xaxis_title="Year",
-    yaxis_title="Cumulative Savings ($)",
-    template='plotly_white',
-    hovermode='x unified'
+summary_table = build_summary_table(
+    total_savings=total_savings_over_period,
+    net_annual_savings=net_annual_savings,
+    annual_current_loss=annual_current_loss,
+    annual_blockchain_cost=annual_blockchain_cost,
+    payback_year=payback_year
 )
-st.plotly_chart(fig, use_container_width=True)
-
-# Scenario Details Section
-st.header("Scenario Details")
-scenario_df = pd.DataFrame({
-    "Parameter": [
-        "Transaction Fee (%)",
-        "Annual Loss Rate on Trapped Cash (%)",
-        "Consulting Fee ($)"
-    ] + list(annual_trapped_funds.keys()) + list(transactions_per_year.keys()),
-    "Value": [
-        f"{transaction_fee_percent}%",
-        f"{annual_loss_rate_percent}%",
-        f"${consulting_fee:,.2f}"
-    ] + [f"${amount:,.2f}" for amount in annual_trapped_funds.values()] +
-    [f"{txn} transactions/year" for txn in transactions_per_year.values()]
-})
-st.table(scenario_df)
 
-# Display the cumulative savings table
-st.header("Yearly Cumulative Savings")
-cumulative_df = pd.DataFrame({
-    "Year": list(range(1, selected_years + 1)),
-    "Cumulative Savings ($)": [f"${value:,.2f}" for value in cumulative_savings]
-})
-st.table(cumulative_df)
+scenario_table = build_scenario_table(
+    transaction_fee=transaction_fee_percent,
+    loss_rate=annual_loss_rate_percent,
+    consulting_fee=consulting_fee,
+    countries=tuple(countries),
+    trapped_funds=funds_arr,
+    transactions=txns_arr
+)
+
+# Function to build the empty cumulative savings figure, whose layout stays fixed across reruns
+def build_cumulative_fig():
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=[],
+        y=[],
+        mode='lines+markers',
+        name='Cumulative Savings',
+        line=dict(color='green')
+    ))
+    fig.update_layout(
+        xaxis_title="Year",
+        yaxis_title="Cumulative Savings ($)",
+        template='plotly_white',
+        hovermode='x unified'
+    )
+    return fig
+
+# Function to size a dataframe so every row shows without scrolling or re-layout
+def table_height(df, row_height=35):
+    return (len(df) + 1) * row_height + 3
+
+# Function to render the charts and tables for the current inputs
+def render_outputs(cumulative_savings, selected_years, selected_scenario, summary_table, scenario_table):
+    # Year axis shared by the chart and the yearly table
+    years_arr = np.arange(1, selected_years + 1, dtype=np.int32)
+
+    # Financial Summary Section
+    st.header("Financial Summary")
+    st.markdown(summary_table)
+
+    # Cumulative Savings Over Time Section
+    st.header("Cumulative Savings Over Time")
+    # Reuse this session's figure and only swap the trace data and title between reruns
+    if "cumulative_fig" not in st.session_state:
+        st.session_state.cumulative_fig = build_cumulative_fig()
+    fig = st.session_state.cumulative_fig
+    fig.data[0].x = years_arr
+    fig.data[0].y = cumulative_savings
+    fig.layout.title.text = f"Cumulative Savings over {selected_years} Years - {selected_scenario}"
+    st.plotly_chart(fig, use_container_width=True, key="cumulative_fig_chart")
+
+    # Scenario Details Section
+    st.header("Scenario Details")
+    st.markdown(scenario_table)
+
+    # Display the cumulative savings table
+    st.header("Yearly Cumulative Savings")
+    # Keep the savings numeric and apply the currency format at display time
+    cumulative_df = pd.DataFrame({
+        "Year": years_arr,
+        "Cumulative Savings ($)": cumulative_savings
+    })
+    st.dataframe(
+        cumulative_df.style.format({"Cumulative Savings ($)": "${:,.2f}"}),
+        hide_index=True,
+        use_container_width=True,
+        height=table_height(cumulative_df)
+    )
+
+render_outputs(cumulative_savings, selected_years, selected_scenario, summary_table, scenario_table)
 
 # Display the Transactions Assumption
 st.markdown("""
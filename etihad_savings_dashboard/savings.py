@@ -0,0 +1,10 @@
+import numpy as np
+
+# Function to sweep cumulative savings over a grid of transaction fees and loss rates,
+# returning an array of shape (len(fees), len(losses), years) for sensitivity panels
+def sweep_savings(trapped_total, fees, losses, consulting_fee, years=10):
+    fees = np.asarray(fees, dtype=np.float64)
+    losses = np.asarray(losses, dtype=np.float64)
+    net_annual_savings = trapped_total * (losses[np.newaxis, :] - fees[:, np.newaxis]) / 100
+    # One-time consulting fee paid in the first year, carried through every cumulative value
+    return net_annual_savings[:, :, np.newaxis] * np.arange(1, years + 1, dtype=np.float64) - consulting_fee
@@ -0,0 +1,17 @@
+import numpy as np
+
+from savings import sweep_savings
+
+
+def test_sweep_matches_closed_form():
+    trapped_total, consulting_fee, years = 1_800_000.0, 250_000.0, 10
+    fees, losses = [1.5, 2.25, 3.0], [10.0, 15.0, 20.0]
+
+    sweep = sweep_savings(trapped_total, fees, losses, consulting_fee, years)
+
+    assert sweep.shape == (len(fees), len(losses), years)
+    year = np.arange(1, years + 1)
+    for i, fee in enumerate(fees):
+        for j, loss in enumerate(losses):
+            net_annual_savings = trapped_total * (loss - fee) / 100
+            np.testing.assert_allclose(sweep[i, j], year * net_annual_savings - consulting_fee)